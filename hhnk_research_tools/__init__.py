@@ -20,7 +20,6 @@ from hhnk_research_tools.dataframe_functions import (
     gdf_write_to_csv,
     gdf_write_to_geopackage,
 )
-from hhnk_research_tools.folder_file_classes.file_class import File
 from hhnk_research_tools.folder_file_classes.folder_file_classes import (
     File,
     FileGDB,
@@ -1,19 +1,95 @@
+import errno
 import json
+import os
 from pathlib import Path
 
+try:
+    import orjson  # faster json parser, optional
+except ImportError:
+    orjson = None
+
 from hhnk_research_tools.general_functions import (
     ensure_file_path,
     get_functions,
     get_variables,
 )
 
+# Errors on stat that mean the path doesnt exist, from pathlib.
+_IGNORED_ERRNOS = (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP)
+_IGNORED_WINERRORS = (
+    21,  # ERROR_NOT_READY - drive exists but is not accessible
+    123,  # ERROR_INVALID_NAME - fix for bpo-35306
+    1921,  # ERROR_CANT_RESOLVE_FILENAME - fix for broken symlink pointing to itself
+)
+
+
+def _json_loads(data):
+    """Parse json with orjson when available. orjson is stricter than json
+    (no NaN/Infinity, no integers above 64 bit), fall back to json for those
+    so the result doesnt depend on orjson being installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 class BasePath:
     """pathlib.path like object that is used as base in File and Folder classes"""
 
-    def __init__(self, base=None):
+    def __init__(self, base=None, resolve: bool = False):
+        """
+        resolve (bool): defaults to False
+            False: make path absolute with os.path.abspath. This collapses '..' by text,
+                without stat calls. With a symlink 'link/../x' becomes '<dir>/x', which
+                can be a different file than the OS would open.
+            True: use Path.resolve, follows symlinks but stats every part of the path.
+        """
         self._base = base
-        self.path = Path(str(base)).absolute().resolve()
+
+        if isinstance(base, BasePath):
+            path = base.path
+        elif isinstance(base, Path):
+            path = base
+        else:
+            path = Path(str(base))
+
+        if resolve:
+            self.path = path.resolve()
+        else:
+            self.path = Path(os.path.abspath(path))
+
+    def __init_subclass__(cls, **kwargs):
+        """Collect functions and variables once per class, instead of on every __repr__."""
+        super().__init_subclass__(**kwargs)
+        helpers = ["_repr_class_members", "_repr_members", "_repr_functions", "_repr_variables"]
+        functions = [i[1:] for i in get_functions(cls, stringify=False) if i[1:] not in helpers]
+        variables = [i for i in get_variables(cls, stringify=False) if i not in helpers]
+        cls._repr_class_members = (tuple(functions), tuple(variables))
+
+    def _repr_members(self):
+        """Class members combined with instance attributes, same as get_functions(self)
+        and get_variables(self).
+        """
+        functions, variables = (set(i) for i in self._repr_class_members)
+        for key, value in vars(self).items():
+            if key.startswith("__"):
+                continue
+            if hasattr(value, "__call__"):
+                functions.add(key)
+                variables.discard(key)
+            else:
+                variables.add(key)
+                functions.discard(key)
+        return sorted(functions), sorted(variables)
+
+    def _repr_functions(self):
+        return " ".join(f".{i}" for i in self._repr_members()[0])
+
+    def _repr_variables(self):
+        return " ".join(self._repr_members()[1])
 
     # decorated properties
     @property
@@ -41,18 +117,45 @@ class BasePath:
     @property
     def path_if_exists(self):
         """Return filepath if the file exists otherwise return None"""
-        if self.exists():
+        if self._stat() is not None:
             return str(self.path)
         return None
 
     # def is_file(self):
     #     return self.path.suffix != ""
 
+    def _stat(self):
+        """Single stat call on the path, returns None on empty or non-existing path.
+        Result is not cached because files are often written by other libraries
+        (gdal, geopandas) without passing through this object.
+        """
+        if not self._base:
+            return None
+        try:
+            return self.path.stat()
+        except OSError as e:
+            # Same errors as Path.exists ignores, other errors (e.g. permissions) are raised.
+            if e.errno in _IGNORED_ERRNOS or getattr(e, "winerror", None) in _IGNORED_WINERRORS:
+                return None
+            raise
+        except ValueError:  # e.g. NUL byte in path
+            return None
+
     def exists(self):
         """Dont return true on empty path."""
-        if not self._base:
-            return False
-        return self.path.exists()
+        return self._stat() is not None
+
+    @property
+    def mtime(self):
+        """Last modification time (timestamp), None if path doesnt exist"""
+        st = self._stat()
+        return st.st_mtime if st is not None else None
+
+    @property
+    def size(self):
+        """Size in bytes, None if path doesnt exist"""
+        st = self._stat()
+        return st.st_size if st is not None else None
 
     def __str__(self):
         return self.base
@@ -61,8 +164,8 @@ class BasePath:
 class File(BasePath):
     """pathlib.Path like file object"""
 
-    def __init__(self, base):
-        super().__init__(base)
+    def __init__(self, base, resolve: bool = False):
+        super().__init__(base, resolve=resolve)
 
     # Path properties
     @property
@@ -78,9 +181,24 @@ class File(BasePath):
 
     def read_json(self):
         if self.path.suffix == ".json":
-            return json.loads(self.path.read_text())
+            return _json_loads(self.path.read_bytes())
         raise TypeError(f"{self.name} is not a json.")
 
+    def read_json_lines(self):
+        """Iterate over one json object per line (.jsonl), without reading
+        the whole file in memory.
+        """
+        if self.path.suffix not in [".jsonl", ".ndjson"]:
+            raise TypeError(f"{self.name} is not a jsonl.")
+
+        def _iter_lines():
+            with self.path.open("rb") as f:
+                for line in f:
+                    if line.strip():
+                        yield _json_loads(line)
+
+        return _iter_lines()
+
     def ensure_file_path(self):
         ensure_file_path(self.path)
 
@@ -97,8 +215,8 @@ class File(BasePath):
         repr_str = f"""{self.path.name} @ {self.path}
 exists: {self.exists()}
 type: {type(self)}
-functions: {get_functions(self)}
-variables: {get_variables(self)}
+functions: {self._repr_functions()}
+variables: {self._repr_variables()}
 """
         return repr_str
 
@@ -108,5 +226,9 @@ variables: {get_variables(self)}
         parents (int): defaults to 0
             number of parents to show
         """
-        parents = min(len(self.path.parts) - 2, parents)  # avoids index-error
-        return self.base.split(self.path.parents[parents].as_posix(), maxsplit=1)[-1]
+        parts = self.path.parts
+        parents = min(len(parts) - 2, parents)  # avoids index-error
+        name = "/".join(parts[-(parents + 1) :])
+        if parents == len(parts) - 2:  # all parents up to the root/drive are shown
+            return name
+        return f"/{name}"
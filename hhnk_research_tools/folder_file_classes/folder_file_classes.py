@@ -9,7 +9,6 @@ import geopandas as gpd
 from hhnk_research_tools import Raster
 from hhnk_research_tools.folder_file_classes.file_class import BasePath, File
 from hhnk_research_tools.folder_file_classes.sqlite_class import Sqlite
-from hhnk_research_tools.general_functions import get_functions, get_variables
 
 # %%
 
@@ -17,8 +16,8 @@ from hhnk_research_tools.general_functions import get_functions, get_variables
 class Folder(BasePath):
     """Base folder class for creating, deleting and see if folder exists"""
 
-    def __init__(self, base, create=False):
-        super().__init__(base)
+    def __init__(self, base, create=False, resolve: bool = False):
+        super().__init__(base, resolve=resolve)
 
         self.files = {}
         self.olayers = {}
@@ -160,16 +159,19 @@ class Folder(BasePath):
     def __repr__(self):
         # FIXME dit gaat mis bij @properties. hrt.ThreediResult aggregate_grid toegevoegd en die crashed de kernel
         # Het lijkt me dat de paths de property opent, zonder dat we dit willen.
-        paths = [i for i in get_variables(self, stringify=False) if issubclass(type(getattr(self, i)), BasePath)]
+        functions, variables = self._repr_members()
+        paths = [i for i in variables if issubclass(type(getattr(self, i)), BasePath)]
         folders = [i for i in paths if isinstance(getattr(self, i), Folder)]
         files = [i for i in paths if i not in folders]
+        functions = " ".join(f".{i}" for i in functions)
+        variables = " ".join(variables)
         repr_str = f"""{self.path.name} @ {self.path}
 Exists: {self.exists()}
 type: {type(self)}
     Folders:\t{folders}
     Files:\t{files}
-functions: {get_functions(self)}
-variables: {get_variables(self)}"""
+functions: {functions}
+variables: {variables}"""
         return repr_str
 
 
@@ -210,8 +212,8 @@ class FileGDB(File):
 exists: {self.exists()}
 type: {type(self)}
 
-functions: {get_functions(self)}
-variables: {get_variables(self)}
+functions: {self._repr_functions()}
+variables: {self._repr_variables()}
 layers (access through .layers): {self.layerlist}"""
         return repr_str
 
@@ -190,8 +190,8 @@ class ThreediResult(Folder):
         return f"""{self.path.name} @ {self.path}
 exists: {self.exists()}
 type: {type(self)}
-functions: {hrt.get_functions(self)}
-variables: {hrt.get_variables(self)}
+functions: {self._repr_functions()}
+variables: {self._repr_variables()}
 """
 
 
@@ -13,7 +13,6 @@ from tqdm.notebook import tqdm
 
 import hhnk_research_tools as hrt
 from hhnk_research_tools.folder_file_classes.file_class import File
-from hhnk_research_tools.general_functions import get_functions, get_variables
 
 # If anything goes wrong in gdal, make sure we raise the errors instead
 # of silenty ignoring the issues.
@@ -422,8 +421,8 @@ type: {type(self)}
 shape: {self.metadata.shape}
 pixelsize: {self.metadata.pixel_width}
 
-functions: {get_functions(self)}
-variables: {get_variables(self)}
+functions: {self._repr_functions()}
+variables: {self._repr_variables()}
 """
 
         else:
@@ -431,8 +430,8 @@ variables: {get_variables(self)}
 exists: {self.exists()}
 type: {type(self)}
 
-functions: {get_functions(self)}
-variables: {get_variables(self)}
+functions: {self._repr_functions()}
+variables: {self._repr_variables()}
 """
 
     def create(self, metadata, nodata, datatype=None, create_options=None, verbose=False, overwrite=False):
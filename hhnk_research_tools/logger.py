@@ -5,7 +5,9 @@ This is applied by default in the __init__ of hhnk_research_tools. So when it is
 in a project, the logging will be set according to these rules.
 """
 
+import functools
 import logging
+import os
 import sys
 
 # from logging import *  # noqa: F401,F403 # type: ignore
@@ -145,19 +147,24 @@ def add_file_handler(
         Dateformat for the filehandler. Can differ from the console logger.
     """
 
+    # Filehandlers added by this function, keyed by absolute filepath.
+    if not hasattr(logger, "_hrt_file_handlers"):
+        logger._hrt_file_handlers = {}
+    filepath = os.path.abspath(str(filepath))
+
     # Remove filehandler when already present
-    for handler in logger.handlers:
-        if isinstance(handler, (logging.FileHandler, RotatingFileHandler)):
-            if Path(handler.stream.name) == filepath:
-                logger.removeHandler(handler)
-                logger.debug("Removed existing FileHandler, logger probably imported multiple times")
+    handler = logger._hrt_file_handlers.pop(filepath, None)
+    if handler is not None:
+        logger.removeHandler(handler)
+        handler.close()
+        logger.debug("Removed existing FileHandler, logger probably imported multiple times")
 
     # TODO  add test that filemode is doing the correct thing
     if not rotate:
-        file_handler = logging.FileHandler(str(filepath), mode=filemode)
+        file_handler = logging.FileHandler(filepath, mode=filemode)
     else:
         # TODO filemode 'w' doesnt seem to reset file on RotatingFileHandler
-        file_handler = RotatingFileHandler(str(filepath), mode=filemode, maxBytes=maxBytes, backupCount=backupCount)
+        file_handler = RotatingFileHandler(filepath, mode=filemode, maxBytes=maxBytes, backupCount=backupCount)
 
     # This formatter includes longdate.
     formatter = logging.Formatter(fmt=fmt, datefmt=datefmt)
@@ -173,6 +180,13 @@ def add_file_handler(
         logger.debug("Added filter to FileHandler")
 
     logger.addHandler(file_handler)
+    logger._hrt_file_handlers[filepath] = file_handler
+
+
+@functools.lru_cache(maxsize=32)
+def _make_formatter(fmt, datefmt):
+    """Return the same Formatter instance for the same fmt and datefmt."""
+    return logging.Formatter(fmt=fmt, datefmt=datefmt)
 
 
 def _add_or_update_streamhandler_format(logger, fmt, datefmt, propagate: bool = True):
@@ -192,13 +206,18 @@ def _add_or_update_streamhandler_format(logger, fmt, datefmt, propagate: bool =
     else:
         logger.propagate = False
 
+    formatter = _make_formatter(fmt, datefmt)
+
     handler_updated = False
     # Check if the logger already has a StreamHandler with the correct formatter
     for handler in logger.handlers:
         if isinstance(handler, logging.StreamHandler):
-            # Update the formatter if the StreamHandler is found
-            handler.setFormatter(logging.Formatter(fmt=fmt, datefmt=datefmt))
-            logger.debug("Updated StreamHandler formatter")
+            # Update the formatter if the StreamHandler is found and formatting differs.
+            # Compare format instead of identity, dictConfig creates its own Formatter instances.
+            current = handler.formatter
+            if current is None or current._fmt != fmt or current.datefmt != datefmt:
+                handler.setFormatter(formatter)
+                logger.debug("Updated StreamHandler formatter")
 
             handler_updated = True
 
@@ -207,7 +226,7 @@ def _add_or_update_streamhandler_format(logger, fmt, datefmt, propagate: bool =
 
     # If no matching StreamHandler was found, add a new one
     stream_handler = logging.StreamHandler(sys.stdout)
-    stream_handler.setFormatter(logging.Formatter(fmt=fmt, datefmt=datefmt))
+    stream_handler.setFormatter(formatter)
     logger.addHandler(stream_handler)
     logger.debug("Added new StreamHandler with formatter")
 
@@ -1,14 +1,13 @@
 import geopandas as gpd
 import numpy as np
-from shapely.geometry import LineString, Point
+import shapely
 
 
 def coordinates_to_points(nodes):
-    """Input is r.nodes"""
-    res_crds = nodes.coordinates
-    crds_lst = np.vstack(res_crds.T)
-    # convert to shapely format so we can create a geodataframe
-    crds = [Point(crd) for crd in crds_lst]
+    """Input is r.nodes, returns np.ndarray of shapely Points"""
+    res_crds = nodes.coordinates  # shape (2, N)
+    # convert to shapely format in one vectorized call so we can create a geodataframe
+    crds = shapely.points(res_crds[0], res_crds[1])
     return crds
 
 
@@ -26,21 +25,22 @@ def line_geometries_to_coords(lines):
     Coordinates read from threedi results netcdf can't be used as is in geodataframe
     Usage: lines = results.lines.channels.line_geometries where results = GridH5ResultAdmin object
     """
-    coords = []
-    for line in lines:
-        if len(line) >= 4:
-            x_coords = line[: int(line.size / 2)].tolist()
-            y_coords = line[int(line.size / 2) :].tolist()
-        else:
-            # Fill in dummy coords
-            x_coords = [0.0, 25000]
-            y_coords = [0.0, 25000]
-        line_list = []
-        for x, y in zip(x_coords, y_coords):
-            line_list.append([x, y])
-        # Creates set of ([x1, y1], [x2, y2] ...., [xn, yn])
-        coords.append(LineString(line_list))
-    return coords
+    # Fill in dummy coords ([x1, x2, y1, y2]) for lines without geometry
+    dummy = np.array([0.0, 25000.0, 0.0, 25000.0])
+    lines = [line if len(line) >= 4 else dummy for line in lines]
+    if len(lines) == 0:
+        return np.array([], dtype=object)
+
+    # Flatten all lines to one (M, 2) coordinate array. First half of each line
+    # contains the x coordinates, second half the y coordinates.
+    lengths = np.array([line.size // 2 for line in lines])
+    xs = np.concatenate([line[: line.size // 2] for line in lines])
+    ys = np.concatenate([line[line.size // 2 :] for line in lines])
+    coords = np.column_stack([xs, ys])
+
+    # Build all LineStrings in one vectorized call, indices link coords to their line.
+    indices = np.repeat(np.arange(len(lines)), lengths)
+    return shapely.linestrings(coords, indices=indices)
 
 
 def extract_boundary_from_polygon(polygon, df_geo_col):
@@ -55,7 +55,5 @@ def extract_boundary_from_polygon(polygon, df_geo_col):
 
 
 def point_geometries_to_wkt(points):
-    coords = []
-    for point_x, point_y in zip(points[0], points[1]):
-        coords.append(Point([point_x, point_y]))
-    return coords
+    """Input is coordinates with shape (2, N), returns np.ndarray of shapely Points"""
+    return shapely.points(points[0], points[1])
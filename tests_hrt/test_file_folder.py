@@ -4,6 +4,8 @@
 
 import importlib
 
+import pytest
+
 import hhnk_research_tools as hrt
 import hhnk_research_tools.folder_file_classes.file_class as fcl
 import hhnk_research_tools.folder_file_classes.folder_file_classes as ffcl
@@ -23,6 +25,69 @@ def test_file():
 
     file = fcl.File(file_path)
     assert file.exists() is True
+    assert file.size == 4
+    assert file.mtime == file_path.stat().st_mtime
+
+    # '..' segments are collapsed, also when the folder doesnt exist
+    file_dotdot = fcl.File(TEMP_DIR / "not_a_folder" / ".." / file_path.name)
+    assert file_dotdot.path == file.path
+    assert file_dotdot.exists() is True
+    assert fcl.File(file_path, resolve=True).path == file_path.resolve()
+
+    file.unlink()
+    assert file.mtime is None
+
+
+def test_file_exists_invalid_path():
+    assert fcl.File(TEMP_DIR / "invalid\0name.txt").exists() is False
+    assert fcl.File(TEMP_DIR / "invalid\0name.txt").path_if_exists is None
+
+
+def test_file_read_json():
+    file_path = TEMP_DIR / f"test_{hrt.get_uuid()}.json"
+    file_path.write_text('{"a": 1, "b": NaN, "c": 123456789012345678901234567890}')
+
+    data = fcl.File(file_path).read_json()
+    assert data["a"] == 1
+    assert data["b"] != data["b"]  # NaN
+    assert data["c"] == 123456789012345678901234567890
+
+    with pytest.raises(TypeError):
+        fcl.File(file_path.with_suffix(".txt")).read_json()
+
+
+def test_file_read_json_lines():
+    file_path = TEMP_DIR / f"test_{hrt.get_uuid()}.jsonl"
+    file_path.write_text('{"a": 1}\n\n{"a": 2}\n')
+
+    assert list(fcl.File(file_path).read_json_lines()) == [{"a": 1}, {"a": 2}]
+
+    with pytest.raises(TypeError):
+        fcl.File(file_path.with_suffix(".json")).read_json_lines()
+
+
+def test_file_repr_members():
+    file = fcl.File(TEMP_DIR / "test.txt")
+    file.extra_variable = 1
+    file.extra_function = print
+
+    helpers = ["_repr_class_members", "_repr_members", "_repr_functions", "_repr_variables"]
+    functions = [i for i in hrt.get_functions(file, stringify=False) if i[1:] not in helpers]
+    variables = [i for i in hrt.get_variables(file, stringify=False) if i not in helpers]
+    assert file._repr_functions() == " ".join(functions)
+    assert file._repr_variables() == " ".join(variables)
+    assert ".extra_function" in file._repr_functions()
+
+
+def test_file_view_name_with_parents():
+    file = fcl.File("/a/b/c/f.txt")
+
+    assert file.view_name_with_parents(0) == "/f.txt"
+    assert file.view_name_with_parents(1) == "/c/f.txt"
+    # No leading slash when all parents up to the root/drive are shown
+    assert file.view_name_with_parents(3) == "a/b/c/f.txt"
+    assert file.view_name_with_parents(5) == "a/b/c/f.txt"
+    assert fcl.File("/f.txt").view_name_with_parents(0) == "f.txt"
 
 
 def test_folder():
@@ -34,4 +99,9 @@ def test_folder():
 # %%
 if __name__ == "__main__":
     test_file()
+    test_file_exists_invalid_path()
+    test_file_read_json()
+    test_file_read_json_lines()
+    test_file_repr_members()
+    test_file_view_name_with_parents()
     test_folder()
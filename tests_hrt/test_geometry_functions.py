@@ -0,0 +1,75 @@
+# %%
+import types
+
+import numpy as np
+from shapely.geometry import LineString, Point
+
+from hhnk_research_tools.threedi.geometry_functions import (
+    coordinates_to_points,
+    line_geometries_to_coords,
+    point_geometries_to_wkt,
+)
+
+# Coordinates as read from threedi results, shape (2, N)
+COORDINATES = np.array([[0.0, 1.5, 100.0], [10.0, 20.5, 300.0]])
+
+
+def test_coordinates_to_points():
+    nodes = types.SimpleNamespace(coordinates=COORDINATES)  # only .coordinates of r.nodes is used
+
+    result = coordinates_to_points(nodes)
+    expected = [Point(crd) for crd in np.vstack(COORDINATES.T)]
+
+    assert len(result) == len(expected)
+    for geom, geom_expected in zip(result, expected):
+        assert geom.equals_exact(geom_expected, tolerance=0)
+
+
+def _line_geometries_to_coords_loop(lines):
+    """Per line LineString construction, reference for the vectorized version."""
+    coords = []
+    for line in lines:
+        if len(line) >= 4:
+            x_coords = line[: int(line.size / 2)].tolist()
+            y_coords = line[int(line.size / 2) :].tolist()
+        else:
+            x_coords = [0.0, 25000]
+            y_coords = [0.0, 25000]
+        coords.append(LineString(list(zip(x_coords, y_coords))))
+    return coords
+
+
+def test_point_geometries_to_wkt():
+    result = point_geometries_to_wkt(COORDINATES)
+    expected = [Point([x, y]) for x, y in zip(COORDINATES[0], COORDINATES[1])]
+
+    assert len(result) == len(expected)
+    for geom, geom_expected in zip(result, expected):
+        assert geom.equals_exact(geom_expected, tolerance=0)
+
+
+def test_line_geometries_to_coords():
+    lines = [
+        np.array([0.0, 1.0, 2.0, 10.0, 11.0, 12.0]),
+        np.array([5.0, 6.0, 7.0, 8.0]),
+        np.array([1.0, 2.0]),  # too short, replaced by dummy line
+        np.array([3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]),
+    ]
+
+    result = line_geometries_to_coords(lines)
+    expected = _line_geometries_to_coords_loop(lines)
+
+    assert len(result) == len(expected)
+    for geom, geom_expected in zip(result, expected):
+        assert geom.equals_exact(geom_expected, tolerance=0)
+
+    empty = line_geometries_to_coords([])
+    assert isinstance(empty, np.ndarray)
+    assert len(empty) == 0
+
+
+# %%
+if __name__ == "__main__":
+    test_coordinates_to_points()
+    test_point_geometries_to_wkt()
+    test_line_geometries_to_coords()
@@ -0,0 +1,53 @@
+# %%
+import logging
+
+import hhnk_research_tools as hrt
+from tests_hrt.config import TEMP_DIR
+
+
+def test_add_file_handler():
+    logger = logging.getLogger(f"test_add_file_handler_{hrt.get_uuid()}")
+    filepath = TEMP_DIR / f"test_{hrt.get_uuid()}.log"
+
+    # Adding the same file twice (str and hrt.File) should replace the first handler.
+    hrt.logging.add_file_handler(logger, str(filepath))
+    first_handler = logger.handlers[0]
+    hrt.logging.add_file_handler(logger, hrt.File(filepath))
+
+    assert len(logger.handlers) == 1
+    assert logger.handlers[0] is not first_handler
+    assert first_handler.stream is None  # closed
+
+    for handler in logger.handlers:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_get_logger_format_multiple_loggers():
+    """Loggers with propagate share the root handlers, last call should set the format."""
+    root_logger = logging.getLogger()
+    root_handlers = list(root_logger.handlers)
+    root_formatters = [h.formatter for h in root_handlers]
+
+    fmt_a = "A|%(name)s| %(message)s"
+    fmt_b = "B|%(name)s| %(message)s"
+    hrt.logging.get_logger("test_format_a", fmt=fmt_a)
+    hrt.logging.get_logger("test_format_b", fmt=fmt_b)
+    hrt.logging.get_logger("test_format_a", fmt=fmt_a)
+
+    stream_handlers = [h for h in root_logger.handlers if isinstance(h, logging.StreamHandler)]
+    assert stream_handlers
+    assert all(h.formatter._fmt == fmt_a for h in stream_handlers)
+
+    # Restore root logger
+    for handler in root_logger.handlers[:]:
+        if handler not in root_handlers:
+            root_logger.removeHandler(handler)
+    for handler, formatter in zip(root_handlers, root_formatters):
+        handler.setFormatter(formatter)
+
+
+# %%
+if __name__ == "__main__":
+    test_add_file_handler()
+    test_get_logger_format_multiple_loggers()